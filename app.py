@@ -1,34 +1,63 @@
 """
 Run:  pip install -r requirements.txt && flask --app app run --debug
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 import random, time
-import openai, re, os, uuid
+import re, os, uuid
 from functools import wraps
-from flask import Flask, render_template, redirect, url_for, flash, request, g
+from flask import Flask, render_template, redirect, url_for, flash, request, g, Response, stream_with_context, abort
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, login_user, login_required, logout_user, current_user, UserMixin
 from flask_migrate import Migrate
+from sqlalchemy import select, and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
+from werkzeug.middleware.proxy_fix import ProxyFix
 from azure.storage.blob import BlobServiceClient, ContentSettings
 from azure.monitor.opentelemetry import configure_azure_monitor
 from config.logging import setup_logging, setup_db_logging, log_db_operation, setup_request_logging
+from config.capture import setup_request_capture
+from config.ratelimit import setup_rate_limiting, limit
+from config.templating import setup_template_cache, setup_template_metrics
+from services.ai_client import AIClient, AIUnavailable
+from services.coalesce import SingleFlight
+from services.scoring import score_one, assessment as scoring_assessment
+from services.assets import save_upload, serve_upload, serve_static, IMMUTABLE_MAX_AGE
+from services.cache import TTLCache
+from services.export import EXPORT_BATCH_SIZE, EXPORT_FORMATS, stream_export
 
 # Initialize app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
 app.config['USE_LOCAL_STORAGE'] = os.getenv('USE_LOCAL_STORAGE', 'false')
 app.config['UPLOAD_FOLDER'] = os.getenv('UPLOAD_FOLDER', os.path.join(app.root_path, 'static', 'uploads'))
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'false') == 'true'
+app.config['ASSET_ACCEL_REDIRECT'] = os.getenv('ASSET_ACCEL_REDIRECT')
+app.config['UPLOAD_MAX_AGE'] = int(os.getenv('UPLOAD_MAX_AGE', '3600'))  # legacy, non-hashed names
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = int(os.getenv('STATIC_MAX_AGE', '3600'))
+app.config['SCREENING_REPORT_TTL_DAYS'] = int(os.getenv('SCREENING_REPORT_TTL_DAYS', '30'))
+app.config['SCREENING_CLAIM_TIMEOUT'] = int(os.getenv('SCREENING_CLAIM_TIMEOUT', '30'))  # how long waiters poll
+# Age at which an unfinished vendor pull counts as abandoned; keep it well
+# above the slowest vendor call or a second worker pulls again
+app.config['SCREENING_CLAIM_STALE_SECONDS'] = int(os.getenv('SCREENING_CLAIM_STALE_SECONDS', '300'))
+app.config['MY_APPLICATIONS_CACHE_SECONDS'] = int(os.getenv('MY_APPLICATIONS_CACHE_SECONDS', '30'))
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///app.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-    'pool_size': 10,
+    'pool_size': int(os.getenv('DB_POOL_SIZE', '10')),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
     'pool_timeout': 30,
     'pool_recycle': 1800,
     'pool_pre_ping': True
 }
 
+# Azure App Service terminates requests in front of the app; trust that many
+# X-Forwarded-For hops so remote_addr (rate limits, logs) is the client's IP
+app.config['PROXY_FIX_X_FOR'] = int(os.getenv('PROXY_FIX_X_FOR', '1'))
+if app.config['PROXY_FIX_X_FOR']:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
+
 # Setup enhanced logging
 logger = setup_logging(app)
 
@@ -36,6 +65,10 @@ db = SQLAlchemy(app)
 with app.app_context():
     setup_db_logging(app, db)
     setup_request_logging(app)
+    setup_request_capture(app)
+    setup_rate_limiting(app)
+    setup_template_cache(app)
+    setup_template_metrics(app)
 migrate = Migrate(app, db)
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
@@ -49,6 +82,7 @@ class User(db.Model, UserMixin):
     role = db.Column(db.String(20), nullable=False)  # 'renter' | 'landlord'
     houses = db.relationship('House', backref='landlord', lazy=True)
     applications = db.relationship('Application', backref='renter', lazy=True)
+    screening_reports = db.relationship('ScreeningReport', backref='renter', lazy=True)
     active = db.Column(db.Boolean(), default=True)
 
     def set_password(self, password):
@@ -75,22 +109,109 @@ class House(db.Model):
     active = db.Column(db.Boolean(), default=True)
 
 class Application(db.Model):
+    # Hot table: only the small fields list pages need. Bulky payloads
+    # live in ApplicationDetail and are loaded on first access.
     id = db.Column(db.Integer, primary_key=True)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     status = db.Column(db.String(20), default='pending')
     phone = db.Column(db.String(20))
     move_in = db.Column(db.Date)
-    notes = db.Column(db.Text)
     credit_score = db.Column(db.Integer)
-    skip_trace = db.Column(db.JSON)
-    income_summary = db.Column(db.JSON)
+    monthly_income = db.Column(db.Integer)  # copied from income_summary
     house_id = db.Column(db.Integer, db.ForeignKey('house.id'), nullable=False)
     renter_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     ai_score = db.Column(db.Integer) #1-10
     ai_assessment = db.Column(db.String(200))   # short rationale
     photo = db.Column(db.String(200))   # holds filename or blob URL
     active = db.Column(db.Boolean(), default=True)
+    idempotency_key = db.Column(db.String(64), unique=True)  # from the application form
+    detail = db.relationship('ApplicationDetail', uselist=False, lazy='select',
+                             cascade='all, delete-orphan')
+    __table_args__ = (
+        # one active application per renter and house
+        db.Index('uq_application_active_house_renter', 'house_id', 'renter_id', unique=True,
+                 postgresql_where=db.text('active'), sqlite_where=db.text('active')),
+        db.Index('ix_application_renter_active_submitted', 'renter_id', 'active', 'submitted_at'),
+        # landlord ranking: top-k per house without sorting every row
+        # (id last so the tiebreak is read in index order too)
+        db.Index('ix_application_house_active_ai_score', 'house_id', 'active', 'ai_score', 'id'),
+        db.Index('ix_application_house_active_credit', 'house_id', 'active', 'credit_score', 'id'),
+        db.Index('ix_application_house_active_income', 'house_id', 'active', 'monthly_income', 'id'),
+    )
+
+    def _detail(self):
+        if self.detail is None:
+            self.detail = ApplicationDetail()
+        return self.detail
+
+    @property
+    def notes(self):
+        return self.detail.notes if self.detail else None
+
+    @notes.setter
+    def notes(self, value):
+        self._detail().notes = value
 
+    @property
+    def skip_trace(self):
+        return self.detail.skip_trace if self.detail else None
+
+    @skip_trace.setter
+    def skip_trace(self, value):
+        self._detail().skip_trace = value
+
+    @property
+    def income_summary(self):
+        return self.detail.income_summary if self.detail else None
+
+    @income_summary.setter
+    def income_summary(self, value):
+        self._detail().income_summary = value
+        self.monthly_income = (value or {}).get("monthly_income")
+
+class ApplicationDetail(db.Model):
+    """Cold side of Application: free text and vendor JSON."""
+    application_id = db.Column(db.Integer, db.ForeignKey('application.id'), primary_key=True)
+    notes = db.Column(db.Text)
+    skip_trace = db.Column(db.JSON)
+    income_summary = db.Column(db.JSON)
+
+class ApplicationArchive(db.Model):
+    """Inactive or long-decided applications moved out of the hot tables."""
+    id = db.Column(db.Integer, primary_key=True)  # original application id
+    submitted_at = db.Column(db.DateTime)
+    status = db.Column(db.String(20))
+    phone = db.Column(db.String(20))
+    move_in = db.Column(db.Date)
+    notes = db.Column(db.Text)
+    credit_score = db.Column(db.Integer)
+    monthly_income = db.Column(db.Integer)
+    skip_trace = db.Column(db.JSON)
+    income_summary = db.Column(db.JSON)
+    house_id = db.Column(db.Integer, nullable=False)
+    renter_id = db.Column(db.Integer, nullable=False, index=True)
+    ai_score = db.Column(db.Integer)
+    ai_assessment = db.Column(db.String(200))
+    photo = db.Column(db.String(200))
+    active = db.Column(db.Boolean())
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class ScreeningReport(db.Model):
+    """Vendor results for a renter, reused by every application while fresh."""
+    id = db.Column(db.Integer, primary_key=True)
+    renter_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    credit_score = db.Column(db.Integer)
+    skip_trace = db.Column(db.JSON)
+    income_summary = db.Column(db.JSON)
+    # True while one worker is calling the vendors for this renter
+    pending = db.Column(db.Boolean, default=False, nullable=False)
+    __table_args__ = (
+        db.Index('ix_screening_report_renter_created', 'renter_id', 'created_at'),
+        # at most one in-flight vendor pull per renter across all workers
+        db.Index('uq_screening_report_pending', 'renter_id', unique=True,
+                 postgresql_where=db.text('pending'), sqlite_where=db.text('pending')),
+    )
 
 
 @login_manager.user_loader
@@ -108,14 +229,14 @@ def create_user(name, email, role, password):
     return user
 
 # -------------------- Helpers -------------------- #
-def run_background_checks(app_obj):
+def fetch_vendor_report(renter):
     """Synchronous fake‑API calls; replace with real HTTP requests later."""
     # ‑‑ credit score
-    app_obj.credit_score = random.randint(550, 800)
+    credit_score = random.randint(550, 800)
 
     # ‑‑ skip trace
-    app_obj.skip_trace = {
-        "emails": [f"{app_obj.renter.email}"],
+    skip_trace = {
+        "emails": [f"{renter.email}"],
         "phones": [f"555‑{random.randint(100,999)}‑{random.randint(1000,9999)}"],
         "addresses": [
             {"street": "123 Main St", "city": "Springfield", "state": "IL"}
@@ -123,22 +244,176 @@ def run_background_checks(app_obj):
     }
 
     # ‑‑ income
-    app_obj.income_summary = {
+    income_summary = {
         "employer": "Acme Corp",
         "monthly_income": random.randint(3000, 8000)
     }
 
     # pretend the vendor took some time
     time.sleep(1)
-    
+
+    return {
+        "credit_score": credit_score,
+        "skip_trace": skip_trace,
+        "income_summary": income_summary
+    }
+
+screening_flights = SingleFlight()
+
+def fresh_screening_report(renter_id):
+    """Returns the newest report still inside the freshness window, as a dict."""
+    cutoff = datetime.utcnow() - timedelta(days=app.config['SCREENING_REPORT_TTL_DAYS'])
+    report = (
+        ScreeningReport.query
+        .filter(
+            ScreeningReport.renter_id == renter_id,
+            ScreeningReport.pending == False,
+            ScreeningReport.created_at >= cutoff
+        )
+        .order_by(ScreeningReport.created_at.desc())
+        .first()
+    )
+    if report is None:
+        return None
+    return {
+        "credit_score": report.credit_score,
+        "skip_trace": report.skip_trace,
+        "income_summary": report.income_summary
+    }
+
+def claim_screening(renter_id):
+    """
+    Inserts the renter's pending report row. The partial unique index lets
+    only one worker hold it; returns None if another worker already does.
+    Claims older than SCREENING_CLAIM_STALE_SECONDS are treated as abandoned.
+    """
+    stale = datetime.utcnow() - timedelta(seconds=app.config['SCREENING_CLAIM_STALE_SECONDS'])
+    ScreeningReport.query.filter(
+        ScreeningReport.renter_id == renter_id,
+        ScreeningReport.pending == True,
+        ScreeningReport.created_at < stale
+    ).delete(synchronize_session=False)
+    claim = ScreeningReport(renter_id=renter_id, pending=True)
+    db.session.add(claim)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return None
+    return claim
+
+def wait_for_screening_report(renter_id):
+    """Polls until the worker holding the claim stores its report."""
+    deadline = time.time() + app.config['SCREENING_CLAIM_TIMEOUT']
+    while time.time() < deadline:
+        # end the read transaction so the other worker's commit is visible
+        db.session.commit()
+        report = fresh_screening_report(renter_id)
+        if report:
+            return report
+        time.sleep(0.25)
+    raise RuntimeError(f"Screening for renter {renter_id} is still in progress")
+
+def get_screening_report(renter):
+    """
+    Returns vendor results for `renter`, pulling them only when no fresh report
+    exists. Concurrent requests for the same renter share a single vendor call:
+    threads of one worker through SingleFlight, workers through a claimed
+    pending row.
+    """
+    report = fresh_screening_report(renter.id)
+    if report:
+        app.logger.info(f"Reusing screening report for renter {renter.id}")
+        return report
+
+    def pull():
+        # another request may have stored one while we waited
+        report = fresh_screening_report(renter.id)
+        if report:
+            return report
+
+        claim = claim_screening(renter.id)
+        if claim is None:
+            app.logger.info(f"Waiting for in-flight screening of renter {renter.id}")
+            return wait_for_screening_report(renter.id)
+
+        # Only touch the row while it is still our claim: if the pull outlived
+        # the stale threshold, another worker may have removed or replaced it
+        still_ours = ScreeningReport.query.filter(
+            ScreeningReport.id == claim.id,
+            ScreeningReport.pending == True,
+            ScreeningReport.created_at == claim.created_at
+        )
+        try:
+            report = fetch_vendor_report(renter)
+        except Exception:
+            still_ours.delete(synchronize_session=False)
+            db.session.commit()
+            raise
+        values = {
+            "credit_score": report["credit_score"],
+            "skip_trace": report["skip_trace"],
+            "income_summary": report["income_summary"],
+            "created_at": datetime.utcnow(),
+        }
+        if not still_ours.update(dict(values, pending=False), synchronize_session=False):
+            app.logger.warning(f"Screening claim for renter {renter.id} expired during the vendor pull")
+            db.session.add(ScreeningReport(renter_id=renter.id, **values))
+        db.session.commit()
+        app.logger.info(f"New screening report stored for renter {renter.id}")
+        return report
+
+    return screening_flights.do(renter.id, pull)
+
+def run_background_checks(app_obj):
+    """Copies the renter's (possibly cached) screening report onto the application."""
+    report = get_screening_report(app_obj.renter)
+    app_obj.credit_score = report["credit_score"]
+    app_obj.skip_trace = report["skip_trace"]
+    app_obj.income_summary = report["income_summary"]
+
     # ‑‑ AI rating --#
     
-openai.api_key = os.getenv('OPENAI_API_KEY')
 GPT_MODEL = "gpt-4o-mini"
+ai_client = AIClient.from_env(logger=app.logger)
+
+def llm_rating(credit, income, rent):
+    """Asks the LLM for (score, assessment). Raises AIUnavailable."""
+    prompt = (
+        "You are an underwriting assistant for a rental property manager. "
+        "Given a prospective tenant's credit score, monthly income and the monthly rent, "
+        "do two things:\n"
+        "1. Assign a single whole‑number rating from 1 (very high risk) to 10 (very low risk).\n"
+        "2. Provide a one‑sentence assessment (max 20 words) explaining the rating.\n\n"
+        f"Credit score: {credit}\n"
+        f"Monthly income (USD): {income}\n"
+        f"Monthly rent (USD): {rent}\n\n"
+        "Respond in the format: <score>|<assessment>"
+    )
+
+    text = ai_client.chat(
+        model=GPT_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=50,
+        temperature=0.2
+    )
+
+    # Parse "8|Good credit and income indicate low risk."
+    if "|" in text:
+        score_part, assess = map(str.strip, text.split("|", 1))
+    else:
+        score_part, assess = text.split()[0], " ".join(text.split()[1:])
+
+    match = re.search(r"\d+", score_part)
+    score = int(match.group()) if match else 1
+    score = max(1, min(score, 10))
+    assess = assess[:180]  # safety truncate
+    return score, assess
 
 def fetch_ai_rating(app_obj):
     """
     Returns (score:int, assessment:str).
+    Clear-cut cases are scored locally; only borderline ones go to the LLM.
     Caches both in the DB to avoid repeat costs.
     """
     try:
@@ -146,46 +421,33 @@ def fetch_ai_rating(app_obj):
             return app_obj.ai_score, app_obj.ai_assessment
 
         credit = app_obj.credit_score
-        income = (app_obj.income_summary or {}).get("monthly_income")
+        income = app_obj.monthly_income
+        rent = app_obj.house.rent
 
         if credit is None or income is None:
             return None, "Awaiting data"
 
-        prompt = (
-            "You are an underwriting assistant for a rental property manager. "
-            "Given a prospective tenant's credit score and monthly income, "
-            "do two things:\n"
-            "1. Assign a single whole‑number rating from 1 (very high risk) to 10 (very low risk).\n"
-            "2. Provide a one‑sentence assessment (max 20 words) explaining the rating.\n\n"
-            f"Credit score: {credit}\n"
-            f"Monthly income (USD): {income}\n\n"
-            "Respond in the format: <score>|<assessment>"
-        )
-
-        resp = openai.chat.completions.create(
-            model=GPT_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=50,
-            temperature=0.2
-        )
-        text = resp.choices[0].message.content.strip()
+        score, ratio, borderline = score_one(credit, income, rent)
+        if not score:
+            return None, "Awaiting data"
 
-        # Parse "8|Good credit and income indicate low risk."
-        if "|" in text:
-            score_part, assess = map(str.strip, text.split("|", 1))
+        if borderline:
+            try:
+                score, assess = llm_rating(credit, income, rent)
+            except AIUnavailable as e:
+                # Show the local score but cache nothing, so the LLM is retried on the next view
+                app.logger.warning(f"AI rating deferred for application {app_obj.id}: {str(e)}")
+                return score, scoring_assessment(score, credit, ratio)
         else:
-            score_part, assess = text.split()[0], " ".join(text.split()[1:])
-
-        match = re.search(r"\d+", score_part)
-        score = int(match.group()) if match else 1
-        score = max(1, min(score, 10))
-        assess = assess[:180]  # safety truncate
+            assess = scoring_assessment(score, credit, ratio)
 
         # Cache
         app_obj.ai_score = score
         app_obj.ai_assessment = assess
         db.session.commit()
-        app.logger.info(f"AI rating complete for application {app_obj.id}: {score}")
+        app.logger.info(
+            f"{'AI' if borderline else 'Local'} rating complete for application {app_obj.id}: {score}"
+        )
         return score, assess
     except Exception as e:
         app.logger.error(f"AI rating failed for application {app_obj.id}: {str(e)}")
@@ -196,6 +458,7 @@ app.jinja_env.globals["fetch_ai_rating"] = fetch_ai_rating
 # -------------------- File Uploads -------------------- #
 UPLOAD_DIR = os.path.join(app.root_path, 'static', 'uploads')
 os.makedirs(UPLOAD_DIR, exist_ok=True)
+os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 ALLOWED_EXT = {'png', 'jpg', 'jpeg', 'gif'}
 
@@ -227,10 +490,29 @@ def upload_to_blob(file_stream, filename, mimetype):
     blob.upload_blob(
         file_stream,
         overwrite=True,
-        content_settings=ContentSettings(content_type=mimetype)
+        content_settings=ContentSettings(
+            content_type=mimetype,
+            # names are unique per upload, so the blob never changes
+            cache_control=f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        )
     )
     return blob.url
 
+@app.route('/uploads/<path:filename>')
+def uploaded_file(filename):
+    return serve_upload(app, filename)
+
+# Prefer precompressed .br/.gz variants of static assets
+app.view_functions['static'] = lambda filename: serve_static(app, filename)
+
+def photo_src(photo):
+    """Blob photos are stored as full URLs, local ones as file names."""
+    if not photo or photo.startswith(('http://', 'https://', '/')):
+        return photo
+    return url_for('uploaded_file', filename=photo)
+
+app.jinja_env.globals["photo_src"] = photo_src
+
 
 # -------------------- Routes -------------------- #
 @app.route('/')
@@ -240,6 +522,7 @@ def home():
 
 # Update the signup route
 @app.route('/signup', methods=['GET', 'POST'])
+@limit('auth')
 def signup():
     if request.method == 'POST':
         app.logger.info(f"New signup attempt for email: {request.form['email']}")
@@ -259,6 +542,7 @@ def signup():
     return render_template('signup.html')
 
 @app.route('/login', methods=['GET', 'POST'])
+@limit('auth')
 def login():
     if request.method == 'POST':
         user = User.query.filter_by(email=request.form['email']).first()
@@ -302,10 +586,8 @@ def new_house():
             if file and allowed_ext(file.filename):
             # For local storage:
                 if app.config["USE_LOCAL_STORAGE"] == "true":  # This could be a flag or configuration setting
-                    filename = secure_filename(file.filename)
-                    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-                    file.save(file_path)
-                    photo_url = filename  # Or store a relative path to file
+                    ext = file.filename.rsplit('.', 1)[1].lower()
+                    photo_url = save_upload(file, app.config["UPLOAD_FOLDER"], ext)  # content-hashed name
 
                 # For Azure Blob Storage:
                 else:
@@ -361,14 +643,24 @@ def delete_house(house_id):
         application.active = False
     
     db.session.commit()
+    for renter_id in {a.renter_id for a in house.applications}:
+        my_applications_cache.invalidate(renter_id)
     app.logger.info(f"House {house_id} and its applications soft-deleted by user {current_user.id}")
 
     flash("House removed from listings.", "info")
     return redirect(url_for("dashboard"))
 
 # ----------- Renter: application form ----------- #
+def find_existing_application(house_id, renter_id, idempotency_key=None):
+    """Returns the renter's active application for the house, or the one submitted with this key."""
+    match = and_(Application.house_id == house_id, Application.active == True)
+    if idempotency_key:
+        match = or_(match, Application.idempotency_key == idempotency_key)
+    return Application.query.filter(Application.renter_id == renter_id, match).first()
+
 @app.route('/apply/<int:house_id>', methods=['GET', 'POST'])
 @login_required
+@limit('apply')
 def apply(house_id):
     if current_user.role != 'renter':
         app.logger.warning(f"Non-renter user {current_user.email} attempted to submit application")
@@ -379,6 +671,14 @@ def apply(house_id):
     
     if request.method == 'POST':
         app.logger.info(f"New application attempt for house {house_id} by {current_user.email}")
+        idempotency_key = request.form.get('idempotency_key') or None
+
+        existing = find_existing_application(house_id, current_user.id, idempotency_key)
+        if existing:
+            app.logger.info(f"Duplicate submission for application {existing.id} ignored")
+            flash('You have already applied for this house.', 'info')
+            return redirect(url_for('my_applications'))
+
         try:
             phone = request.form['phone']
             move_in = request.form['move_in']
@@ -389,14 +689,34 @@ def apply(house_id):
                 renter_id=current_user.id,
                 phone=phone,
                 move_in=datetime.strptime(move_in, "%Y-%m-%d").date(),
-                notes=notes
+                notes=notes,
+                idempotency_key=idempotency_key
             )
             db.session.add(app_obj)
-            db.session.commit()
+            try:
+                db.session.commit()
+            except IntegrityError:
+                # A concurrent submission won the insert; it runs the screening
+                db.session.rollback()
+                existing = find_existing_application(house_id, current_user.id, idempotency_key)
+                app.logger.info(
+                    f"Concurrent duplicate submission coalesced into application {existing.id if existing else None}"
+                )
+                flash('You have already applied for this house.', 'info')
+                return redirect(url_for('my_applications'))
+            my_applications_cache.invalidate(current_user.id)
 
             app.logger.info(f"Running background checks for application {app_obj.id}")
-            run_background_checks(app_obj)
-            db.session.commit()
+            try:
+                run_background_checks(app_obj)
+                db.session.commit()
+            except Exception:
+                # An unscreened row would answer every retry with "already applied"
+                db.session.rollback()
+                db.session.delete(app_obj)
+                db.session.commit()
+                my_applications_cache.invalidate(current_user.id)
+                raise
             
             app.logger.info(f"Fetching AI rating for application {app_obj.id}")
             fetch_ai_rating(app_obj)
@@ -409,9 +729,58 @@ def apply(house_id):
             db.session.rollback()
             flash('Error submitting application', 'danger')
 
-    # GET – show the form
-    return render_template('application_form.html', house=house)
+    # GET – show the form with a fresh key so retries and double clicks are recognised
+    return render_template('application_form.html', house=house, idempotency_key=uuid.uuid4().hex)
+
+
+# ----------- Renter: my applications ----------- #
+MY_APPLICATIONS_PER_PAGE = 20
+my_applications_cache = TTLCache(ttl=app.config['MY_APPLICATIONS_CACHE_SECONDS'])
+
+def renter_applications_page(renter_id, page):
+    """
+    One page of a renter's applications as plain dicts, newest first.
+    Served by ix_application_renter_active_submitted; one extra row is
+    fetched to tell whether a next page exists without a COUNT query.
+    """
+    key = (renter_id, page)
+    cached = my_applications_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stmt = (
+        select(
+            Application.id,
+            Application.status,
+            Application.submitted_at,
+            Application.move_in,
+            House.id.label('house_id'),
+            House.title,
+            House.rent
+        )
+        .join(House, Application.house_id == House.id)
+        .where(Application.renter_id == renter_id, Application.active == True)
+        .order_by(Application.submitted_at.desc(), Application.id.desc())
+        .limit(MY_APPLICATIONS_PER_PAGE + 1)
+        .offset((page - 1) * MY_APPLICATIONS_PER_PAGE)
+    )
+    rows = [dict(row) for row in db.session.execute(stmt).mappings()]
+    result = {
+        'applications': rows[:MY_APPLICATIONS_PER_PAGE],
+        'has_next': len(rows) > MY_APPLICATIONS_PER_PAGE
+    }
+    my_applications_cache.set(key, result)
+    return result
 
+@app.route('/my-applications')
+@login_required
+def my_applications():
+    if current_user.role != 'renter':
+        flash('Access denied', 'warning')
+        return redirect(url_for('home'))
+    page = max(request.args.get('page', 1, type=int), 1)
+    result = renter_applications_page(current_user.id, page)
+    return render_template('my_applications.html', page=page, **result)
 
 # ----------- Landlord dashboard ----------- #
 @app.route('/dashboard')
@@ -423,6 +792,23 @@ def dashboard():
     houses = House.query.filter_by(landlord_id=current_user.id, active=True).all()
     return render_template('dashboard.html', houses=houses)
 
+APPLICATIONS_PER_PAGE = 25
+MAX_TOP_K = 100
+APPLICATION_STATUSES = ('pending', 'approved', 'denied')
+APPLICATION_SORTS = {
+    'ai_score': Application.ai_score,
+    'credit_score': Application.credit_score,
+    'income': Application.monthly_income,
+    'move_in': Application.move_in,
+    'status': Application.status,
+    'submitted_at': Application.submitted_at,
+}
+APPLICATION_MINIMUMS = {
+    'min_score': Application.ai_score,
+    'min_credit': Application.credit_score,
+    'min_income': Application.monthly_income,
+}
+
 @app.route('/applications/<int:house_id>')
 @login_required
 def view_applications(house_id):
@@ -430,8 +816,56 @@ def view_applications(house_id):
     if house.landlord_id != current_user.id:
         flash('Access denied', 'warning')
         return redirect(url_for('home'))
-    applications = Application.query.filter_by(house_id=house_id, active=True).all()
-    return render_template('applications.html', house=house, applications=applications)
+
+    args = request.args
+    sort = args.get('sort', 'submitted_at')
+    if sort not in APPLICATION_SORTS:
+        sort = 'submitted_at'
+    direction = 'asc' if args.get('dir') == 'asc' else 'desc'
+    column = APPLICATION_SORTS[sort]
+
+    query = (
+        Application.query
+        .options(joinedload(Application.renter))
+        .filter(Application.house_id == house_id, Application.active == True)
+    )
+    if args.get('status') in APPLICATION_STATUSES:
+        query = query.filter(Application.status == args['status'])
+    for param, filter_column in APPLICATION_MINIMUMS.items():
+        minimum = args.get(param, type=int)
+        if minimum is not None:
+            query = query.filter(filter_column >= minimum)
+
+    top = args.get('top', type=int)
+    if top is not None:
+        # Top-k straight off the (house_id, active, <column>, id) index: unrated
+        # rows can't rank, and a plain ASC/DESC on both keys is a forward or
+        # backward index scan that stops after `top` rows
+        top = max(1, min(top, MAX_TOP_K))
+        if direction == 'asc':
+            order = (column.asc(), Application.id.asc())
+        else:
+            order = (column.desc(), Application.id.desc())
+        applications = query.filter(column.isnot(None)).order_by(*order).limit(top).all()
+        pagination = None
+    else:
+        order = column.asc().nulls_last() if direction == 'asc' else column.desc().nulls_last()
+        pagination = query.order_by(order, Application.id).paginate(
+            page=args.get('page', 1, type=int),
+            per_page=APPLICATIONS_PER_PAGE,
+            error_out=False
+        )
+        applications = pagination.items
+
+    return render_template(
+        'applications.html',
+        house=house,
+        applications=applications,
+        pagination=pagination,
+        sort=sort,
+        direction=direction,
+        top=top
+    )
 
 @app.route('/applications/<int:app_id>/set/<string:new_status>', methods=['POST'])
 @login_required
@@ -443,5 +877,76 @@ def set_status(app_id, new_status):
         return redirect(url_for('home'))
     app_obj.status = new_status
     db.session.commit()
+    my_applications_cache.invalidate(app_obj.renter_id)
     flash(f'Application {new_status}.', 'info')
     return redirect(url_for('view_applications', house_id=house.id))
+
+# ----------- Landlord: export applications ----------- #
+def _export_response(stmt, fmt, basename):
+    """Streams the rows selected by `stmt` as CSV or NDJSON."""
+    if fmt not in EXPORT_FORMATS:
+        abort(404)
+
+    stmt = stmt.order_by(Application.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    @stream_with_context
+    def generate():
+        result = db.session.execute(stmt)
+        try:
+            yield from stream_export(result, fmt)
+        finally:
+            result.close()
+
+    app.logger.info(f"Export of {basename}.{fmt} started by user {current_user.id}")
+    return Response(
+        generate(),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={
+            'Content-Disposition': f'attachment; filename="{basename}.{fmt}"',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+def _export_select():
+    return (
+        select(
+            Application.id,
+            Application.house_id,
+            House.title.label('house_title'),
+            User.name.label('renter_name'),
+            User.email.label('renter_email'),
+            Application.status,
+            Application.submitted_at,
+            Application.move_in,
+            Application.phone,
+            ApplicationDetail.notes,
+            Application.credit_score,
+            Application.ai_score,
+            Application.ai_assessment,
+            ApplicationDetail.skip_trace,
+            ApplicationDetail.income_summary
+        )
+        .join(House, Application.house_id == House.id)
+        .outerjoin(ApplicationDetail, ApplicationDetail.application_id == Application.id)
+        .join(User, Application.renter_id == User.id)
+        .where(Application.active == True)
+    )
+
+@app.route('/applications/<int:house_id>/export.<string:fmt>')
+@login_required
+def export_applications(house_id, fmt):
+    house = House.query.get_or_404(house_id)
+    if house.landlord_id != current_user.id:
+        flash('Access denied', 'warning')
+        return redirect(url_for('home'))
+    stmt = _export_select().where(Application.house_id == house_id)
+    return _export_response(stmt, fmt, f"house-{house_id}-applications")
+
+@app.route('/applications/export.<string:fmt>')
+@login_required
+def export_portfolio(fmt):
+    if current_user.role != 'landlord':
+        flash('Access denied', 'warning')
+        return redirect(url_for('home'))
+    stmt = _export_select().where(House.landlord_id == current_user.id, House.active == True)
+    return _export_response(stmt, fmt, "portfolio-applications")
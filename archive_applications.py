@@ -0,0 +1,68 @@
+"""
+Move inactive or long-decided applications into application_archive.
+
+Run:  python archive_applications.py [--days 180] [--batch-size 1000]
+
+Meant to be scheduled (cron / WebJob). Rows are moved in small batches, each
+in its own transaction, so the hot tables are never locked for long.
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, insert, delete, and_, or_, literal, DateTime
+
+from app import app, db, Application, ApplicationDetail, ApplicationArchive
+
+DECIDED = ('approved', 'denied')
+HOT_COLUMNS = [
+    'id', 'submitted_at', 'status', 'phone', 'move_in', 'credit_score', 'monthly_income',
+    'house_id', 'renter_id', 'ai_score', 'ai_assessment', 'photo', 'active'
+]
+COLD_COLUMNS = ['notes', 'skip_trace', 'income_summary']
+
+
+def archive(days, batch_size):
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    eligible = and_(
+        Application.submitted_at < cutoff,
+        or_(Application.active == False, Application.status.in_(DECIDED))
+    )
+
+    total = 0
+    while True:
+        ids = db.session.scalars(
+            select(Application.id).where(eligible).order_by(Application.id).limit(batch_size)
+        ).all()
+        if not ids:
+            break
+
+        source = (
+            select(
+                *[getattr(Application, c) for c in HOT_COLUMNS],
+                *[getattr(ApplicationDetail, c) for c in COLD_COLUMNS],
+                literal(datetime.utcnow(), DateTime).label('archived_at')
+            )
+            .outerjoin(ApplicationDetail, ApplicationDetail.application_id == Application.id)
+            .where(Application.id.in_(ids))
+        )
+        db.session.execute(
+            insert(ApplicationArchive).from_select(HOT_COLUMNS + COLD_COLUMNS + ['archived_at'], source)
+        )
+        db.session.execute(delete(ApplicationDetail).where(ApplicationDetail.application_id.in_(ids)))
+        db.session.execute(delete(Application).where(Application.id.in_(ids)))
+        db.session.commit()
+
+        total += len(ids)
+        app.logger.info(f"Archived {len(ids)} applications (up to id {ids[-1]})")
+
+    print(f"Archived {total} applications older than {days} days")
+    return total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Archive inactive or decided applications")
+    parser.add_argument('--days', type=int, default=180)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+    with app.app_context():
+        archive(args.days, args.batch_size)
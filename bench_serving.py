@@ -0,0 +1,136 @@
+"""
+Compare concurrent-request capacity of one sync worker vs one gevent worker.
+
+Run:  python bench_serving.py [--renters 20] [--ai-delay 0.5]
+
+For each mode a fresh SQLite database and a single gunicorn worker are
+started, the fake OpenAI server answers with --ai-delay of latency, and
+every renter submits an application at the same time. Each submission waits
+on the (fake) screening vendor and possibly the AI rating, which is the
+network-bound work the gevent profile is meant to overlap.
+
+The rate limiter stays on, as in production. Each renter sends its own
+X-Forwarded-For address so per-IP buckets behave as they would for real
+clients; applications shed (503) or limited (429) are reported as rejected.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from services.fake_openai import serve as serve_fake_openai
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODES = {
+    'sync': ['gunicorn', '-w', '1', '--timeout', '600'],
+    'gevent': ['gunicorn', '-c', 'gunicorn.gevent.conf.py'],
+}
+
+
+def start_server(mode, port, env):
+    proc = subprocess.Popen(
+        MODES[mode] + ['-b', f'127.0.0.1:{port}', 'app:app'],
+        cwd=HERE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f'http://127.0.0.1:{port}/login', timeout=1)
+            return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.kill()
+    raise SystemExit(f"{mode} server did not start")
+
+
+def signup_and_login(base_url, name, role, ip):
+    client = httpx.Client(base_url=base_url, timeout=120, headers={'X-Forwarded-For': ip})
+    email = f"{name}@bench.local"
+    client.post('/signup', data={'name': name, 'email': email, 'password': 'bench', 'role': role})
+    client.post('/login', data={'email': email, 'password': 'bench'})
+    return client
+
+
+def run_mode(mode, port, renters, ai_base_url):
+    db_path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    env = dict(
+        os.environ,
+        FLASK_ENV='development',
+        SECRET_KEY='bench',
+        DATABASE_URL=f'sqlite:///{db_path}',
+        OPENAI_API_KEY='bench',
+        OPENAI_BASE_URL=ai_base_url,
+        RATELIMIT_BACKEND='memory',
+        PROXY_FIX_X_FOR='1',
+        WEB_CONCURRENCY='1',
+        BIND=f'127.0.0.1:{port}',
+    )
+    subprocess.run([sys.executable, 'reset_db.py'], cwd=HERE, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    proc = start_server(mode, port, env)
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        landlord = signup_and_login(base_url, f'{mode}-landlord', 'landlord', '10.0.0.1')
+        landlord.post('/houses/new', data={'title': 'Bench House', 'description': 'Bench', 'rent': '1800'})
+        clients = [
+            signup_and_login(base_url, f'{mode}-renter-{i}', 'renter', f'10.1.{i // 250}.{i % 250 + 1}')
+            for i in range(renters)
+        ]
+
+        latencies = []
+        rejected = []
+        lock = threading.Lock()
+
+        def submit(client):
+            start = time.perf_counter()
+            resp = client.post('/apply/1', data={
+                'phone': '555-0100', 'move_in': '2030-01-01', 'notes': '',
+                'idempotency_key': uuid.uuid4().hex
+            })
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                if resp.status_code >= 400:
+                    rejected.append(resp.status_code)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=renters) as pool:
+            list(pool.map(submit, clients))
+        wall = time.perf_counter() - start
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    return {
+        'wall': wall,
+        'throughput': renters / wall,
+        'p50': statistics.median(latencies),
+        'max': max(latencies),
+        'rejected': len(rejected),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Sync vs gevent capacity per worker")
+    parser.add_argument('--renters', type=int, default=20)
+    parser.add_argument('--ai-delay', type=float, default=0.5)
+    parser.add_argument('--port', type=int, default=8811)
+    args = parser.parse_args()
+
+    fake = serve_fake_openai(port=0, delay=args.ai_delay)
+    threading.Thread(target=fake.serve_forever, daemon=True).start()
+    ai_base_url = f'http://127.0.0.1:{fake.server_address[1]}/v1'
+
+    print(f"{args.renters} concurrent applications, one worker per mode")
+    print(f"{'mode':<8}{'wall s':>9}{'req/s':>9}{'p50 s':>9}{'max s':>9}{'rejected':>10}")
+    for mode in MODES:
+        r = run_mode(mode, args.port, args.renters, ai_base_url)
+        print(f"{mode:<8}{r['wall']:>9.2f}{r['throughput']:>9.2f}{r['p50']:>9.2f}{r['max']:>9.2f}{r['rejected']:>10}")
+    fake.shutdown()
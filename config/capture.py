@@ -0,0 +1,83 @@
+import os
+import re
+import hmac
+import json
+import hashlib
+import time
+import logging
+from logging.handlers import RotatingFileHandler
+from flask import g, request
+from flask_login import current_user
+
+REDACTED = '[REDACTED]'
+SECRET_FIELD = re.compile(r'pass|secret|token|key|csrf|card|ssn', re.IGNORECASE)
+# Match SECRET_FIELD but carry no secret; replay needs them verbatim
+PUBLIC_FIELDS = {'idempotency_key'}
+
+
+def sanitize_form(form):
+    """Returns form fields with anything secret-looking redacted"""
+    return {
+        key: REDACTED if SECRET_FIELD.search(key) and key not in PUBLIC_FIELDS else value
+        for key, value in form.items()
+    }
+
+
+def pseudonymous_id(app, user_id):
+    """Stable per-user id for captures that can't be mapped back without SECRET_KEY"""
+    key = (app.secret_key or '').encode()
+    return hmac.new(key, str(user_id).encode(), hashlib.sha256).hexdigest()[:16]
+
+
+def setup_request_capture(app):
+    """
+    Opt-in traffic capture (CAPTURE_REQUESTS=true).
+    Appends one sanitized JSON record per request to CAPTURE_FILE so the
+    traffic can be replayed later with replay.py.
+    """
+    if os.getenv('CAPTURE_REQUESTS', 'false') != 'true':
+        return None
+
+    capture_file = os.getenv('CAPTURE_FILE', os.path.join(app.root_path, 'logs', 'requests.jsonl'))
+    os.makedirs(os.path.dirname(capture_file), exist_ok=True)
+
+    handler = RotatingFileHandler(
+        capture_file,
+        maxBytes=int(os.getenv('CAPTURE_MAX_BYTES', 50*1024*1024)),  # 50MB
+        backupCount=int(os.getenv('CAPTURE_BACKUP_COUNT', 5))
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    capture_logger = logging.getLogger('request_capture')
+    capture_logger.handlers = [handler]
+    capture_logger.setLevel(logging.INFO)
+    capture_logger.propagate = False
+
+    @app.before_request
+    def start_capture():
+        g.capture_start = time.time()
+
+    @app.after_request
+    def capture_request(response):
+        if request.endpoint == 'static':
+            return response
+        try:
+            record = {
+                'ts': g.capture_start,
+                'method': request.method,
+                'path': request.path,
+                'query': request.query_string.decode('utf-8', 'replace'),
+                'form': sanitize_form(request.form),
+                'files': sorted(request.files.keys()),
+                'role': current_user.role if current_user.is_authenticated else None,
+                'user': pseudonymous_id(app, current_user.id) if current_user.is_authenticated else None,
+                'status': response.status_code,
+                'duration_ms': round((time.time() - g.capture_start) * 1000, 2)
+            }
+            capture_logger.info(json.dumps(record))
+        except Exception as e:
+            app.logger.warning(f"Request capture failed: {str(e)}")
+        return response
+
+    app.logger.info(f"Request capture enabled: {capture_file}")
+    return capture_logger
@@ -0,0 +1,211 @@
+import os
+import time
+import sqlite3
+import threading
+from functools import wraps
+from flask import request, current_app
+from flask_login import current_user
+from opentelemetry import metrics
+
+# Per route class: scope -> (tokens per minute, burst)
+ROUTE_RULES = {
+    'auth': {'ip': (20, 10), 'account': (5, 5)},
+    'apply': {'ip': (20, 10), 'user': (5, 3)},
+}
+
+# Max requests of a route class in flight per worker
+ROUTE_CONCURRENCY = {
+    'auth': int(os.getenv('RATELIMIT_AUTH_CONCURRENCY', 8)),
+    'apply': int(os.getenv('RATELIMIT_APPLY_CONCURRENCY', 4)),
+}
+
+
+def refill(state, rate, burst, now):
+    """Token level of a bucket stored as (tokens, updated) at time `now`"""
+    tokens, updated = state
+    return min(burst, tokens + (now - updated) * rate)
+
+
+def wait_time(levels, buckets):
+    """Seconds until every bucket holds a whole token (0 if they all do now)"""
+    return max(
+        [(1 - tokens) / rate for tokens, (_, rate, _) in zip(levels, buckets) if tokens < 1],
+        default=0
+    )
+
+
+class MemoryBackend:
+    """Token buckets for a single process"""
+    MAX_KEYS = 10000
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, buckets, now):
+        """
+        Takes one token from every (key, rate, burst) bucket, or from none of
+        them; returns 0 if allowed, else seconds until all have one available
+        """
+        with self._lock:
+            levels = [
+                refill(self._buckets.get(key, (burst, now)), rate, burst, now)
+                for key, rate, burst in buckets
+            ]
+            retry_after = wait_time(levels, buckets)
+            if not retry_after:
+                for (key, _, _), tokens in zip(buckets, levels):
+                    self._buckets[key] = (tokens - 1, now)
+                if len(self._buckets) > self.MAX_KEYS:
+                    self._prune(now)
+            return retry_after
+
+    def _prune(self, now, idle=3600):
+        # Every rule refills within an hour, so idle buckets carry no state
+        for key, (_, updated) in list(self._buckets.items()):
+            if now - updated > idle:
+                del self._buckets[key]
+
+
+class SQLiteBackend:
+    """Token buckets shared by every worker on the host through a SQLite file"""
+    PRUNE_INTERVAL = 300
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._last_prune = time.time()
+        self._connect().execute(
+            'CREATE TABLE IF NOT EXISTS bucket (key TEXT PRIMARY KEY, tokens REAL, updated REAL)'
+        )
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def take(self, buckets, now):
+        """Same contract as MemoryBackend.take; raises sqlite3.OperationalError if the file stays locked"""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            levels = []
+            for key, rate, burst in buckets:
+                row = conn.execute('SELECT tokens, updated FROM bucket WHERE key = ?', (key,)).fetchone()
+                levels.append(refill(row or (burst, now), rate, burst, now))
+            retry_after = wait_time(levels, buckets)
+            if not retry_after:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO bucket (key, tokens, updated) VALUES (?, ?, ?)',
+                    [(key, tokens - 1, now) for (key, _, _), tokens in zip(buckets, levels)]
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if now - self._last_prune > self.PRUNE_INTERVAL:
+            self._last_prune = now
+            self._prune(conn, now)
+        return retry_after
+
+    def _prune(self, conn, now, idle=3600):
+        # Same rule as MemoryBackend: idle buckets are full again, so drop them
+        conn.execute('DELETE FROM bucket WHERE updated < ?', (now - idle,))
+
+
+class RateLimiter:
+    def __init__(self, backend, rules=ROUTE_RULES, concurrency=ROUTE_CONCURRENCY):
+        self.backend = backend
+        self.rules = rules
+        self.slots = {name: threading.BoundedSemaphore(n) for name, n in concurrency.items()}
+        meter = metrics.get_meter(__name__)
+        self.decisions = meter.create_counter(
+            'ratelimit.decisions',
+            description='Rate limiter decisions by route class and outcome'
+        )
+
+    def record(self, route_class, endpoint, decision):
+        self.decisions.add(1, {'route_class': route_class, 'endpoint': endpoint, 'decision': decision})
+
+    def take(self, route_class, endpoint, identities):
+        """Returns the longest Retry-After among exhausted buckets (0 if allowed)"""
+        buckets = [
+            (f'{endpoint}:{scope}:{identities[scope]}', per_minute / 60.0, burst)
+            for scope, (per_minute, burst) in self.rules.get(route_class, {}).items()
+            if identities.get(scope) is not None
+        ]
+        if not buckets:
+            return 0
+        # All-or-nothing: a request refused by one bucket doesn't spend the others
+        return self.backend.take(buckets, time.time())
+
+
+def _reject(status, retry_after, message):
+    return message, status, {'Retry-After': str(max(1, int(retry_after + 0.999)))}
+
+
+def limit(route_class, methods=('POST',)):
+    """Token-bucket limit plus a concurrency cap for an expensive route"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            limiter = current_app.extensions.get('rate_limiter')
+            if limiter is None or request.method not in methods:
+                return f(*args, **kwargs)
+
+            endpoint = request.endpoint
+            identities = {
+                'ip': request.remote_addr,
+                'user': current_user.id if current_user.is_authenticated else None,
+                'account': (request.form.get('email') or '').strip().lower() or None
+            }
+            try:
+                retry_after = limiter.take(route_class, endpoint, identities)
+            except sqlite3.OperationalError as e:
+                # A busy limiter file must not take the route down with it
+                limiter.record(route_class, endpoint, 'backend_error')
+                current_app.logger.error(f"Rate limiter unavailable, allowing request: {str(e)}")
+                retry_after = 0
+            if retry_after:
+                limiter.record(route_class, endpoint, 'rate_limited')
+                current_app.logger.warning(
+                    f"Rate limited: {str({'endpoint': endpoint, 'ip': identities['ip'], 'user_id': identities['user']})}"
+                )
+                return _reject(429, retry_after, 'Too Many Requests')
+
+            slots = limiter.slots.get(route_class)
+            if slots is not None and not slots.acquire(blocking=False):
+                limiter.record(route_class, endpoint, 'shed')
+                current_app.logger.warning(f"Load shed: {str({'endpoint': endpoint})}")
+                return _reject(503, 1, 'Service Unavailable')
+
+            limiter.record(route_class, endpoint, 'allowed')
+            try:
+                return f(*args, **kwargs)
+            finally:
+                if slots is not None:
+                    slots.release()
+        return wrapper
+    return decorator
+
+
+def setup_rate_limiting(app):
+    """
+    Configure admission control for expensive routes.
+    RATELIMIT_BACKEND is 'memory' (default, per worker), 'sqlite:///path'
+    (shared across workers on one host) or 'off'.
+    """
+    spec = os.getenv('RATELIMIT_BACKEND', 'memory')
+    if spec == 'off':
+        return None
+    if spec.startswith('sqlite:///'):
+        backend = SQLiteBackend(spec[len('sqlite:///'):])
+    else:
+        backend = MemoryBackend()
+    limiter = RateLimiter(backend)
+    app.extensions['rate_limiter'] = limiter
+    app.logger.info(f"Rate limiting enabled with {type(backend).__name__}")
+    return limiter
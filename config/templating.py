@@ -0,0 +1,88 @@
+import os
+import time
+from hashlib import sha1
+from flask import g, before_render_template, template_rendered
+from jinja2 import FileSystemBytecodeCache
+from opentelemetry import metrics
+
+
+class TemplateNameBytecodeCache(FileSystemBytecodeCache):
+    """
+    Keys entries on the template name only. Jinja's default key hashes the
+    absolute template path, so a cache built in CI would never match the
+    deployed tree; the source checksum Jinja stores with each entry still
+    invalidates stale bytecode.
+    """
+
+    def get_cache_key(self, name, filename=None):
+        return sha1(name.encode('utf-8')).hexdigest()
+
+
+def compile_templates(app):
+    names = app.jinja_env.list_templates(extensions=['html'])
+    for name in names:
+        app.jinja_env.get_template(name)
+    return names
+
+
+def warm_templates(app):
+    """
+    Compile every template in a fresh web worker so its first requests don't
+    pay for it. Called from the gunicorn post_worker_init hook rather than at
+    import, so CLI scripts and `flask db` skip it (TEMPLATE_WARMUP=false
+    turns it off).
+    """
+    if os.getenv('TEMPLATE_WARMUP', 'true') != 'true':
+        return
+    start_time = time.time()
+    try:
+        names = compile_templates(app)
+        app.logger.info(
+            f"Templates warmed: {str({'count': len(names), 'duration_ms': round((time.time() - start_time) * 1000, 2)})}"
+        )
+    except Exception as e:
+        app.logger.warning(f"Template warmup failed: {str(e)}")
+
+
+def setup_template_cache(app):
+    """
+    Share compiled templates between workers through a bytecode cache on
+    disk. `flask compile-templates` fills the cache at build time; entries
+    are keyed by template name so they stay valid wherever the tree is
+    deployed.
+    """
+    cache_dir = os.getenv('TEMPLATE_CACHE_DIR', os.path.join(app.root_path, 'jinja_cache'))
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = TemplateNameBytecodeCache(cache_dir)
+
+    @app.cli.command('compile-templates')
+    def compile_templates_command():
+        """Precompile all templates into the bytecode cache."""
+        names = compile_templates(app)
+        print(f"Compiled {len(names)} templates into {cache_dir}")
+
+
+def setup_template_metrics(app):
+    """Record per-template render time as a histogram and in the logs"""
+    meter = metrics.get_meter(__name__)
+    render_histogram = meter.create_histogram(
+        'template.render_duration',
+        unit='ms',
+        description='Jinja template render time'
+    )
+
+    @before_render_template.connect_via(app)
+    def start_render(sender, template, context, **extra):
+        g.setdefault('template_timers', []).append(time.time())
+
+    @template_rendered.connect_via(app)
+    def finish_render(sender, template, context, **extra):
+        timers = g.get('template_timers')
+        if not timers:
+            return
+        duration_ms = (time.time() - timers.pop()) * 1000
+        render_histogram.record(duration_ms, {'template': template.name})
+        app.logger.info(
+            f"Template rendered: {template.name}",
+            extra={'duration_ms': round(duration_ms, 2)}
+        )
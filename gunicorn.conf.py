@@ -0,0 +1,12 @@
+"""
+Default gunicorn settings, picked up automatically when gunicorn runs from
+the project root (gunicorn app:app). Only worker hooks live here; serving
+options stay on the command line or in gunicorn.gevent.conf.py.
+"""
+
+
+def post_worker_init(worker):
+    # Warm templates in web workers only, not in CLI scripts importing app
+    from app import app
+    from config.templating import warm_templates
+    warm_templates(app)
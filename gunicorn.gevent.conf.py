@@ -0,0 +1,44 @@
+"""
+Gevent serving profile.
+
+Run:  gunicorn -c gunicorn.gevent.conf.py app:app
+
+apply, view_applications (AI rating) and new_house (Blob upload) spend most
+of their time waiting on the network. Under gevent every socket wait yields
+to other requests, so one worker keeps serving while vendor, OpenAI and Blob
+calls are in flight, without rewriting those views or their clients.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:8000')
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() + 1))
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', '100'))
+timeout = int(os.getenv('WORKER_TIMEOUT', '120'))
+keepalive = 5
+# Don't preload: the app must be imported after the worker has monkey-patched
+preload_app = False
+
+# Many greenlets share one worker's connection pool and AI client
+os.environ.setdefault('DB_POOL_SIZE', '20')
+os.environ.setdefault('DB_MAX_OVERFLOW', '20')
+os.environ.setdefault('OPENAI_MAX_CONCURRENCY', '16')
+# The sync default (4 applies in flight per worker) would shed most of the
+# concurrency gevent adds; stay below the DB pool so applies never queue on it
+os.environ.setdefault('RATELIMIT_APPLY_CONCURRENCY', '32')
+
+
+def post_fork(server, worker):
+    # psycopg2 talks to Postgres in C, so it needs its own cooperative patch
+    try:
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+    except ImportError:
+        server.log.warning("psycogreen not installed; Postgres queries will block the worker")
+
+
+def post_worker_init(worker):
+    from app import app
+    from config.templating import warm_templates
+    warm_templates(app)
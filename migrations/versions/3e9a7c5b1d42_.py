@@ -0,0 +1,37 @@
+"""add id to the per-house ranking indexes
+
+Revision ID: 3e9a7c5b1d42
+Revises: f4b7c9e1a2d5
+Create Date: 2026-10-20 11:05:48.230917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e9a7c5b1d42'
+down_revision = 'f4b7c9e1a2d5'
+branch_labels = None
+depends_on = None
+
+
+RANKING_INDEXES = {
+    'ix_application_house_active_ai_score': 'ai_score',
+    'ix_application_house_active_credit': 'credit_score',
+    'ix_application_house_active_income': 'monthly_income',
+}
+
+
+def upgrade():
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        for name, column in RANKING_INDEXES.items():
+            batch_op.drop_index(name)
+            batch_op.create_index(name, ['house_id', 'active', column, 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        for name, column in RANKING_INDEXES.items():
+            batch_op.drop_index(name)
+            batch_op.create_index(name, ['house_id', 'active', column], unique=False)
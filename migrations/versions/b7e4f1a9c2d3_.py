@@ -0,0 +1,104 @@
+"""split application into hot/cold tables, add archive
+
+Revision ID: b7e4f1a9c2d3
+Revises: a3c1d2e4f5b6
+Create Date: 2026-10-19 14:03:27.552190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4f1a9c2d3'
+down_revision = 'a3c1d2e4f5b6'
+branch_labels = None
+depends_on = None
+
+
+application = sa.table(
+    'application',
+    sa.column('id', sa.Integer),
+    sa.column('income_summary', sa.JSON),
+    sa.column('monthly_income', sa.Integer),
+)
+
+
+def upgrade():
+    op.create_table('application_detail',
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('skip_trace', sa.JSON(), nullable=True),
+    sa.Column('income_summary', sa.JSON(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['application.id'], ),
+    sa.PrimaryKeyConstraint('application_id')
+    )
+    op.execute(
+        "INSERT INTO application_detail (application_id, notes, skip_trace, income_summary) "
+        "SELECT id, notes, skip_trace, income_summary FROM application"
+    )
+
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('monthly_income', sa.Integer(), nullable=True))
+
+    # Backfill the hot income column from the JSON payload
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(application.c.id, application.c.income_summary)).fetchall()
+    for app_id, income_summary in rows:
+        income = (income_summary or {}).get('monthly_income')
+        if income is not None:
+            conn.execute(
+                application.update().where(application.c.id == app_id).values(monthly_income=income)
+            )
+
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.drop_column('income_summary')
+        batch_op.drop_column('skip_trace')
+        batch_op.drop_column('notes')
+
+    op.create_table('application_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('submitted_at', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('move_in', sa.Date(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('credit_score', sa.Integer(), nullable=True),
+    sa.Column('monthly_income', sa.Integer(), nullable=True),
+    sa.Column('skip_trace', sa.JSON(), nullable=True),
+    sa.Column('income_summary', sa.JSON(), nullable=True),
+    sa.Column('house_id', sa.Integer(), nullable=False),
+    sa.Column('renter_id', sa.Integer(), nullable=False),
+    sa.Column('ai_score', sa.Integer(), nullable=True),
+    sa.Column('ai_assessment', sa.String(length=200), nullable=True),
+    sa.Column('photo', sa.String(length=200), nullable=True),
+    sa.Column('active', sa.Boolean(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('application_archive', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_application_archive_renter_id'), ['renter_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('application_archive', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_application_archive_renter_id'))
+
+    op.drop_table('application_archive')
+
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('notes', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('skip_trace', sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column('income_summary', sa.JSON(), nullable=True))
+
+    op.execute(
+        "UPDATE application SET "
+        "notes = (SELECT d.notes FROM application_detail d WHERE d.application_id = application.id), "
+        "skip_trace = (SELECT d.skip_trace FROM application_detail d WHERE d.application_id = application.id), "
+        "income_summary = (SELECT d.income_summary FROM application_detail d WHERE d.application_id = application.id)"
+    )
+
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.drop_column('monthly_income')
+
+    op.drop_table('application_detail')
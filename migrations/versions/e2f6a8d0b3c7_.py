@@ -0,0 +1,42 @@
+"""idempotent application submission
+
+Revision ID: e2f6a8d0b3c7
+Revises: d9a3b6c4e8f1
+Create Date: 2026-10-19 20:15:36.402918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f6a8d0b3c7'
+down_revision = 'd9a3b6c4e8f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+        batch_op.create_unique_constraint('uq_application_idempotency_key', ['idempotency_key'])
+
+    # Existing double submissions: keep the first one active
+    op.execute(
+        "UPDATE application SET active = false "
+        "WHERE active AND EXISTS ("
+        "SELECT 1 FROM application a2 "
+        "WHERE a2.active AND a2.house_id = application.house_id "
+        "AND a2.renter_id = application.renter_id AND a2.id < application.id)"
+    )
+
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.create_index('uq_application_active_house_renter', ['house_id', 'renter_id'], unique=True,
+                              postgresql_where=sa.text('active'), sqlite_where=sa.text('active'))
+
+
+def downgrade():
+    with op.batch_alter_table('application', schema=None) as batch_op:
+        batch_op.drop_index('uq_application_active_house_renter')
+        batch_op.drop_constraint('uq_application_idempotency_key', type_='unique')
+        batch_op.drop_column('idempotency_key')
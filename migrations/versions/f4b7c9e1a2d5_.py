@@ -0,0 +1,29 @@
+"""claim in-flight screening pulls per renter
+
+Revision ID: f4b7c9e1a2d5
+Revises: e2f6a8d0b3c7
+Create Date: 2026-10-20 09:37:12.581443
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4b7c9e1a2d5'
+down_revision = 'e2f6a8d0b3c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('screening_report', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('pending', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.create_index('uq_screening_report_pending', ['renter_id'], unique=True,
+                              postgresql_where=sa.text('pending'), sqlite_where=sa.text('pending'))
+
+
+def downgrade():
+    with op.batch_alter_table('screening_report', schema=None) as batch_op:
+        batch_op.drop_index('uq_screening_report_pending')
+        batch_op.drop_column('pending')
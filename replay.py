@@ -0,0 +1,182 @@
+"""
+Replay captured traffic (see config/capture.py) against a local instance.
+
+Run:  RATELIMIT_BACKEND=off flask --app app run          (the target)
+      python replay.py logs/requests.jsonl --base-url http://127.0.0.1:5000
+          [--speed 2.0] [--concurrency 16]
+          [--login renter=renter@example.com:secret]
+
+Requests keep their original spacing divided by --speed (0 sends them as fast
+as possible). Every captured user (a pseudonymous id) replays through its own
+session: a throwaway account with the captured role is signed up on the target
+for each one. Records captured before user ids were recorded fall back to one
+--login session per role.
+
+The target must run without rate limiting: replayed traffic all comes from one
+address, so limits would turn the expensive routes into cheap 429s. Replay
+stops if signing up the accounts is rate limited and warns if any replayed
+request is.
+
+Redacted fields make /login and /signup unreplayable, so they are skipped;
+elsewhere they are dropped rather than sent as the literal placeholder.
+Prints per-route latency of the capture next to the replay, and how many
+replayed requests got a different status than the captured one.
+"""
+import argparse
+import json
+import re
+import statistics
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+SKIP_PATHS = {'/login', '/signup', '/logout'}
+REDACTED = '[REDACTED]'
+RATE_LIMITED = "The target is rate limiting replayed traffic; restart it with RATELIMIT_BACKEND=off"
+
+
+def route_key(method, path):
+    return f"{method} " + re.sub(r'/\d+', '/<id>', path)
+
+
+def load_records(paths):
+    records = []
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    records.append(json.loads(line))
+    records.sort(key=lambda r: r['ts'])
+    return [r for r in records if r['path'] not in SKIP_PATHS and not r['path'].startswith('/static/')]
+
+
+def login(client, email, password, who):
+    resp = client.post('/login', data={'email': email, 'password': password})
+    if resp.status_code == 429:
+        raise SystemExit(RATE_LIMITED)
+    if resp.status_code != 302:
+        raise SystemExit(f"Login for {who} failed with status {resp.status_code}")
+    return client
+
+
+def login_clients(base_url, records, logins, password, timeout):
+    """
+    Returns sessions keyed by ('user', id) for every captured user, and by
+    ('role', role) for --login fallbacks. ('role', None) is anonymous.
+    """
+    clients = {('role', None): httpx.Client(base_url=base_url, timeout=timeout)}
+    for spec in logins:
+        role, creds = spec.split('=', 1)
+        email, role_password = creds.split(':', 1)
+        client = httpx.Client(base_url=base_url, timeout=timeout)
+        clients[('role', role)] = login(client, email, role_password, f"role {role!r}")
+
+    users = {r['user']: r['role'] for r in records if r.get('user')}
+    for user, role in users.items():
+        client = httpx.Client(base_url=base_url, timeout=timeout)
+        email = f"replay-{user}@replay.local"
+        resp = client.post('/signup', data={'name': f"Replay {user}", 'email': email,
+                                            'password': password, 'role': role})
+        if resp.status_code == 429:
+            raise SystemExit(RATE_LIMITED)
+        # signup fails harmlessly when a previous replay created the account
+        clients[('user', user)] = login(client, email, password, f"captured user {user}")
+    return clients
+
+
+def client_for(record, clients):
+    if record.get('user'):
+        return clients[('user', record['user'])]
+    return clients.get(('role', record.get('role'))) or clients[('role', None)]
+
+
+def replay_form(record):
+    form = {key: value for key, value in (record.get('form') or {}).items() if value != REDACTED}
+    return form or None
+
+
+def percentile(values, pct):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[pct - 1]
+
+
+def replay(records, clients, speed, concurrency):
+    results = defaultdict(lambda: {'original': [], 'replay': [], 'errors': 0, 'mismatches': 0, 'rate_limited': 0})
+    lock = threading.Lock()
+
+    def send(record):
+        client = client_for(record, clients)
+        url = record['path'] + (f"?{record['query']}" if record.get('query') else '')
+        start = time.perf_counter()
+        try:
+            resp = client.request(record['method'], url, data=replay_form(record))
+            status = resp.status_code
+        except httpx.HTTPError:
+            status = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with lock:
+            entry = results[route_key(record['method'], record['path'])]
+            entry['original'].append(record['duration_ms'])
+            entry['replay'].append(elapsed_ms)
+            entry['errors'] += status is None or status >= 500
+            entry['mismatches'] += status != record.get('status')
+            entry['rate_limited'] += status == 429
+
+    first_ts = records[0]['ts']
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for record in records:
+            if speed:
+                delay = (record['ts'] - first_ts) / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(send, record)
+    return results, time.perf_counter() - started
+
+
+def report(results, wall_time):
+    header = (f"{'route':<45}{'count':>7}{'orig p50':>10}{'new p50':>10}{'orig p95':>10}"
+              f"{'new p95':>10}{'Δ p95':>10}{'errors':>8}{'status≠':>9}")
+    print(header)
+    print('-' * len(header))
+    total = rate_limited = 0
+    for key in sorted(results):
+        entry = results[key]
+        orig, new = entry['original'], entry['replay']
+        total += len(new)
+        rate_limited += entry['rate_limited']
+        o50, n50 = percentile(orig, 50), percentile(new, 50)
+        o95, n95 = percentile(orig, 95), percentile(new, 95)
+        print(f"{key:<45}{len(new):>7}{o50:>10.1f}{n50:>10.1f}{o95:>10.1f}{n95:>10.1f}{n95 - o95:>+10.1f}"
+              f"{entry['errors']:>8}{entry['mismatches']:>9}")
+    print(f"\nReplayed {total} requests in {wall_time:.1f}s (latencies in ms)")
+    print("status≠ counts replayed requests whose status differs from the captured one")
+    if rate_limited:
+        print(f"\nWARNING: {rate_limited} replayed requests were rejected with 429. {RATE_LIMITED};"
+              " latencies of the affected routes are not comparable.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay captured traffic")
+    parser.add_argument('files', nargs='+', help="capture files, e.g. logs/requests.jsonl*")
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--login', action='append', default=[], metavar='ROLE=EMAIL:PASSWORD',
+                        help="session for records captured without a user id")
+    parser.add_argument('--password', default='replay', help="password of the replay accounts")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="time scale; 2 replays twice as fast, 0 as fast as possible")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    args = parser.parse_args()
+
+    records = load_records(args.files)
+    if not records:
+        raise SystemExit("No replayable records found")
+    clients = login_clients(args.base_url, records, args.login, args.password, args.timeout)
+    results, wall_time = replay(records, clients, args.speed, args.concurrency)
+    report(results, wall_time)
@@ -0,0 +1,85 @@
+"""
+Rescore every active application with the local scorer in one pass.
+
+Run:  python rescore.py [--batch-size 5000] [--local-only]
+
+Borderline rows are left alone: an existing (LLM) rating is kept, and rows
+without one are rated by fetch_ai_rating the next time they are viewed.
+With --local-only they get the local score too.
+"""
+import argparse
+import time
+
+import numpy as np
+from sqlalchemy import select, update
+
+from app import app, db, Application, House
+from services.scoring import score_batch, is_borderline, assessment
+
+
+def rescore(batch_size, local_only):
+    stmt = (
+        select(Application.id, Application.credit_score, Application.monthly_income,
+               Application.ai_score, House.rent)
+        .join(House, Application.house_id == House.id)
+        .where(Application.active == True)
+        .order_by(Application.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    start = time.perf_counter()
+    # Only a few numbers per row are kept, so the whole table fits in memory
+    # and is scored in a single vectorized call.
+    ids, credit, income, rent, rated = [], [], [], [], []
+    for rows in db.session.execute(stmt).partitions():
+        for r in rows:
+            ids.append(r.id)
+            credit.append(np.nan if r.credit_score is None else r.credit_score)
+            income.append(np.nan if r.monthly_income is None else r.monthly_income)
+            rent.append(r.rent)
+            rated.append(r.ai_score is not None)
+
+    credit = np.array(credit, dtype=np.float64)
+    scores, ratios = score_batch(credit, income, rent)
+    if local_only:
+        borderline = np.zeros(len(scores), dtype=bool)
+    else:
+        borderline = is_borderline(scores)
+
+    params = []
+    unrated_borderline = 0
+    for i, app_id in enumerate(ids):
+        score = int(scores[i])
+        if borderline[i]:
+            # Don't throw away (and re-bill) an existing LLM rating
+            unrated_borderline += not rated[i]
+        elif not score:
+            # inputs missing: any stored rating no longer has a basis
+            if rated[i]:
+                params.append({"id": app_id, "ai_score": None, "ai_assessment": None})
+        else:
+            params.append({
+                "id": app_id,
+                "ai_score": score,
+                "ai_assessment": assessment(score, credit[i], ratios[i])
+            })
+
+    for offset in range(0, len(params), batch_size):
+        db.session.execute(update(Application), params[offset:offset + batch_size])
+        db.session.commit()
+
+    total = len(ids)
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed else 0
+    print(f"Rescored {total} applications in {elapsed:.2f}s ({rate:,.0f}/sec); "
+          f"{int(borderline.sum())} borderline kept, {unrated_borderline} still need an LLM rating")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Rescore all applications locally")
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--local-only', action='store_true',
+                        help="store local scores for borderline cases too")
+    args = parser.parse_args()
+    with app.app_context():
+        rescore(args.batch_size, args.local_only)
@@ -0,0 +1,183 @@
+"""
+Pooled, concurrency-limited OpenAI client.
+
+All AI calls go through one shared keep-alive httpx pool with explicit
+timeouts, a cap on in-flight requests, retry with backoff on 429/5xx and a
+per-minute token budget. When the budget or the concurrency cap is hit the
+call fails fast with AIUnavailable so callers can degrade instead of hanging
+a request thread.
+
+Point OPENAI_BASE_URL at `python -m services.fake_openai` to run without the
+real API.
+"""
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import httpx
+import openai
+
+
+class AIUnavailable(Exception):
+    """Raised when a call is skipped (budget/concurrency) or retries ran out."""
+
+
+class TokenBudget:
+    """Sliding one-minute window of tokens spent (0 disables the budget)."""
+
+    def __init__(self, tokens_per_minute):
+        self.tokens_per_minute = tokens_per_minute
+        self._spent = deque()  # [timestamp, tokens], updated in place by settle()
+        self._lock = threading.Lock()
+
+    def _used(self, now):
+        while self._spent and now - self._spent[0][0] >= 60:
+            self._spent.popleft()
+        return sum(tokens for _, tokens in self._spent)
+
+    def reserve(self, tokens):
+        """Returns a reservation to settle() later, or None if over budget."""
+        now = time.monotonic()
+        if not self.tokens_per_minute:
+            return [now, tokens]
+        with self._lock:
+            if self._used(now) + tokens > self.tokens_per_minute:
+                return None
+            reservation = [now, tokens]
+            self._spent.append(reservation)
+            return reservation
+
+    def settle(self, reservation, actual):
+        """
+        Replaces the estimate with the real usage (0 refunds it). The entry
+        keeps its original timestamp, so it leaves the window in one piece.
+        """
+        if actual is None:
+            return
+        with self._lock:
+            reservation[1] = actual
+
+
+class AIClient:
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    MAX_BACKOFF = 8.0  # never sleep longer than this between retries
+
+    def __init__(self, api_key=None, base_url=None, connect_timeout=5.0,
+                 read_timeout=30.0, max_concurrency=4, max_retries=3,
+                 tokens_per_minute=0, acquire_timeout=2.0, retry_deadline=20.0, logger=None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.acquire_timeout = acquire_timeout
+        self.retry_deadline = retry_deadline
+        self.budget = TokenBudget(tokens_per_minute)
+        self.logger = logger
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, logger=None):
+        return cls(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            base_url=os.getenv('OPENAI_BASE_URL'),
+            connect_timeout=float(os.getenv('OPENAI_CONNECT_TIMEOUT', '5')),
+            read_timeout=float(os.getenv('OPENAI_READ_TIMEOUT', '30')),
+            max_concurrency=int(os.getenv('OPENAI_MAX_CONCURRENCY', '4')),
+            max_retries=int(os.getenv('OPENAI_MAX_RETRIES', '3')),
+            tokens_per_minute=int(os.getenv('OPENAI_TOKENS_PER_MINUTE', '0')),
+            retry_deadline=float(os.getenv('OPENAI_RETRY_DEADLINE', '20')),
+            logger=logger
+        )
+
+    @property
+    def client(self):
+        # Built lazily so each gunicorn worker gets its own pool after fork
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    http_client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=self.max_concurrency,
+                            max_keepalive_connections=self.max_concurrency,
+                            keepalive_expiry=60
+                        )
+                    )
+                    self._client = openai.OpenAI(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                        http_client=http_client,
+                        timeout=self.timeout,
+                        max_retries=0  # retries are handled below
+                    )
+        return self._client
+
+    @staticmethod
+    def estimate_tokens(messages, max_tokens):
+        # ~4 characters per token is close enough for budgeting
+        chars = sum(len(m.get('content') or '') for m in messages)
+        return chars // 4 + max_tokens
+
+    def _backoff(self, attempt, error):
+        """Seconds to wait before the next attempt, or None to give up now."""
+        retry_after = None
+        response = getattr(error, 'response', None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('retry-after'))
+            except (TypeError, ValueError):
+                retry_after = None
+        if retry_after is None:
+            return min(self.MAX_BACKOFF, 0.5 * 2 ** attempt) * (0.5 + random.random() / 2)
+        # The server wants a longer pause than a request thread should wait
+        if retry_after > self.MAX_BACKOFF:
+            return None
+        return max(0.0, retry_after)
+
+    def _should_retry(self, error):
+        if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError)):
+            return True
+        return isinstance(error, openai.APIStatusError) and error.status_code in self.RETRY_STATUS
+
+    def chat(self, model, messages, max_tokens, temperature=0.2):
+        """Returns the completion text, or raises AIUnavailable."""
+        reservation = self.budget.reserve(self.estimate_tokens(messages, max_tokens))
+        if reservation is None:
+            raise AIUnavailable("token budget exhausted")
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            self.budget.settle(reservation, 0)
+            raise AIUnavailable("too many AI calls in flight")
+        try:
+            deadline = time.monotonic() + self.retry_deadline
+            for attempt in range(self.max_retries + 1):
+                try:
+                    resp = self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature
+                    )
+                    usage = getattr(resp, 'usage', None)
+                    self.budget.settle(reservation, getattr(usage, 'total_tokens', None))
+                    return resp.choices[0].message.content.strip()
+                except openai.OpenAIError as e:
+                    if not self._should_retry(e) or attempt == self.max_retries:
+                        self.budget.settle(reservation, 0)
+                        raise AIUnavailable(str(e)) from e
+                    delay = self._backoff(attempt, e)
+                    if delay is None or time.monotonic() + delay > deadline:
+                        self.budget.settle(reservation, 0)
+                        raise AIUnavailable(f"retry window exceeded: {e}") from e
+                    if self.logger:
+                        self.logger.warning(
+                            f"AI call failed ({e.__class__.__name__}), retry {attempt + 1} in {delay:.1f}s"
+                        )
+                    time.sleep(delay)
+        finally:
+            self._slots.release()
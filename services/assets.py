@@ -0,0 +1,147 @@
+"""
+Cache-friendly serving of uploaded photos and static assets.
+
+Uploads get content-hashed names, so their URLs never change meaning and can
+be cached forever (`immutable`). File bodies can be handed to the front
+server instead of being streamed by a worker thread:
+
+  * USE_X_SENDFILE=true        Apache / lighttpd (X-Sendfile, handled by Flask)
+  * ASSET_ACCEL_REDIRECT=/_uploads/   nginx internal location (X-Accel-Redirect)
+
+Static text assets can be precompressed once at build time:
+
+    python -m services.assets compress static/
+"""
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+from flask import Response, request, send_from_directory, abort
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # optional; only gzip variants are produced without it
+    brotli = None
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+HASHED_NAME = re.compile(r'^[0-9a-f]{32}\.[a-z0-9]+$')
+COMPRESSIBLE_EXT = {'.css', '.js', '.svg', '.html', '.json', '.txt', '.map', '.xml'}
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def content_hashed_name(file_storage, ext):
+    """Returns '<sha256[:32]>.<ext>' for the upload and rewinds its stream."""
+    digest = hashlib.sha256()
+    stream = file_storage.stream
+    for chunk in iter(lambda: stream.read(64 * 1024), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return f"{digest.hexdigest()[:32]}.{ext}"
+
+
+def save_upload(file_storage, folder, ext):
+    """Saves the upload under its content hash; identical photos are stored once."""
+    filename = content_hashed_name(file_storage, ext)
+    path = os.path.join(folder, filename)
+    if not os.path.exists(path):
+        file_storage.save(path)
+    return filename
+
+
+def is_immutable(filename):
+    return bool(HASHED_NAME.match(filename))
+
+
+def _cache(response, filename, max_age):
+    response.cache_control.public = True
+    if is_immutable(filename):
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = max_age
+    return response
+
+
+def serve_upload(app, filename):
+    """
+    Sends an uploaded file with ETag, Range and long-lived caching, or
+    delegates the body to nginx when ASSET_ACCEL_REDIRECT is set.
+    """
+    folder = app.config['UPLOAD_FOLDER']
+    accel_prefix = app.config.get('ASSET_ACCEL_REDIRECT')
+    max_age = app.config.get('UPLOAD_MAX_AGE', 3600)
+
+    if accel_prefix:
+        path = safe_join(folder, filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response.headers['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + filename
+        return _cache(response, filename, max_age)
+
+    # conditional=True gives ETag / Last-Modified / Range handling;
+    # USE_X_SENDFILE makes Flask emit X-Sendfile instead of the body.
+    response = send_from_directory(folder, filename, conditional=True, max_age=max_age)
+    return _cache(response, filename, max_age)
+
+
+def serve_static(app, filename):
+    """
+    Static route that prefers a precompressed .br/.gz variant when the client
+    accepts it. Falls back to Flask's normal static handling.
+    """
+    accepted = request.accept_encodings
+    path = safe_join(app.static_folder, filename)
+    if path is not None:
+        for encoding, suffix in ENCODINGS:
+            if accepted[encoding] and os.path.isfile(path + suffix):
+                response = send_from_directory(
+                    app.static_folder,
+                    filename + suffix,
+                    mimetype=mimetypes.guess_type(filename)[0],
+                    conditional=True,
+                    max_age=app.get_send_file_max_age(filename)
+                )
+                response.headers['Content-Encoding'] = encoding
+                response.vary.add('Accept-Encoding')
+                return response
+    response = app.send_static_file(filename)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def precompress(folder, skip=('uploads',), min_size=256):
+    """Writes .gz (and .br when brotli is installed) next to text assets."""
+    written = 0
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = [d for d in dirs if d not in skip]
+        for name in files:
+            if os.path.splitext(name)[1] not in COMPRESSIBLE_EXT:
+                continue
+            path = os.path.join(root, name)
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) < min_size:
+                continue
+            with open(path + '.gz', 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            written += 1
+            if brotli is not None:
+                with open(path + '.br', 'wb') as f:
+                    f.write(brotli.compress(data, quality=11))
+                written += 1
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Asset build helpers")
+    sub = parser.add_subparsers(dest='command', required=True)
+    compress = sub.add_parser('compress', help="precompress static text assets")
+    compress.add_argument('folder', nargs='?', default='static')
+    args = parser.parse_args()
+    count = precompress(args.folder)
+    print(f"Wrote {count} compressed variants{'' if brotli else ' (brotli not installed, gzip only)'}")
@@ -0,0 +1,50 @@
+"""
+Small in-process TTL cache for per-user query results.
+
+Entries are keyed by tuples whose first element is the owner (e.g. a renter
+id), so everything cached for one owner can be dropped at once when their
+data changes. Each worker has its own cache; keep TTLs short so other
+workers converge quickly after an invalidation.
+"""
+import threading
+import time
+
+
+class TTLCache:
+    def __init__(self, ttl, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self.max_entries:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, owner):
+        with self._lock:
+            for key in [k for k in self._data if k[0] == owner]:
+                del self._data[key]
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [k for k, (expires, _) in self._data.items() if expires < now]
+        for key in expired:
+            del self._data[key]
+        if len(self._data) >= self.max_entries:
+            # still full: drop the entries closest to expiry
+            for key, _ in sorted(self._data.items(), key=lambda kv: kv[1][0])[:self.max_entries // 10]:
+                del self._data[key]
@@ -0,0 +1,119 @@
+"""
+Streaming CSV / NDJSON export of applications for landlords.
+
+Rows are pulled from the database in fixed-size partitions and written out
+as they arrive, so memory stays bounded regardless of how many applications
+a house (or a whole portfolio) has collected.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Column order for CSV output. JSON payloads are flattened with dotted keys.
+EXPORT_FIELDS = [
+    'id',
+    'house_id',
+    'house_title',
+    'renter_name',
+    'renter_email',
+    'status',
+    'submitted_at',
+    'move_in',
+    'phone',
+    'notes',
+    'credit_score',
+    'ai_score',
+    'ai_assessment',
+    'skip_trace.emails',
+    'skip_trace.phones',
+    'skip_trace.addresses',
+    'income_summary.employer',
+    'income_summary.monthly_income',
+]
+
+
+# Leading characters spreadsheets treat as the start of a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _scalar(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def flatten(value, prefix, out):
+    """
+    Flattens nested JSON into `out` using dotted keys.
+    Lists of scalars are joined with '; ', lists of objects are kept as JSON.
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flatten(item, f"{prefix}.{key}", out)
+    elif isinstance(value, list):
+        if all(not isinstance(item, (dict, list)) for item in value):
+            out[prefix] = "; ".join(str(item) for item in value)
+        else:
+            out[prefix] = json.dumps(value, separators=(',', ':'))
+    else:
+        out[prefix] = _scalar(value)
+    return out
+
+
+def flatten_row(row):
+    """Turns one result row (a mapping) into a flat dict of export fields."""
+    out = {}
+    for key, value in row.items():
+        if key in ('skip_trace', 'income_summary'):
+            if value:
+                flatten(value, key, out)
+        else:
+            out[key] = _scalar(value)
+    return out
+
+
+def csv_safe(row):
+    """Neutralises spreadsheet formulas in text cells by prefixing a quote."""
+    return {
+        key: f"'{value}" if isinstance(value, str) and value.startswith(FORMULA_PREFIXES) else value
+        for key, value in row.items()
+    }
+
+
+def iter_partitions(result):
+    """Yields lists of flattened rows, one per database partition."""
+    for partition in result.mappings().partitions():
+        yield [flatten_row(row) for row in partition]
+
+
+def stream_csv(result):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    # Send the header straight away so the download starts immediately
+    yield buffer.getvalue()
+
+    for rows in iter_partitions(result):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(csv_safe(row) for row in rows)
+        yield buffer.getvalue()
+
+
+def stream_ndjson(result):
+    for rows in iter_partitions(result):
+        yield "".join(json.dumps(row, default=str) + "\n" for row in rows)
+
+
+def stream_export(result, fmt):
+    if fmt == 'csv':
+        return stream_csv(result)
+    return stream_ndjson(result)
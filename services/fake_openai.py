@@ -0,0 +1,96 @@
+"""
+Minimal local stand-in for the OpenAI chat completions API.
+
+Run:  python -m services.fake_openai --port 8765
+Then: OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=test flask --app app run
+
+--delay adds latency to every call and --fail-every N answers every Nth
+call with a 503, which is handy for exercising timeouts and retries.
+"""
+import argparse
+import json
+import random
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_rating(prompt):
+    credit = re.search(r"Credit score: (\d+)", prompt)
+    income = re.search(r"Monthly income \(USD\): (\d+)", prompt)
+    credit = int(credit.group(1)) if credit else 600
+    income = int(income.group(1)) if income else 3000
+    score = max(1, min(10, round((credit - 500) / 35 + (income - 3000) / 2000)))
+    return f"{score}|Fake rating from credit {credit} and income {income}."
+
+
+def make_handler(delay, fail_every):
+    calls = {'count': 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _send(self, status, payload, headers=None):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            calls['count'] += 1
+
+            if delay:
+                time.sleep(delay)
+            if fail_every and calls['count'] % fail_every == 0:
+                return self._send(503, {'error': {'message': 'fake overload'}}, {'Retry-After': '0'})
+            if not self.path.endswith('/chat/completions'):
+                return self._send(404, {'error': {'message': 'not found'}})
+
+            prompt = (request.get('messages') or [{}])[-1].get('content', '')
+            text = fake_rating(prompt)
+            prompt_tokens = len(prompt) // 4
+            completion_tokens = len(text) // 4
+            self._send(200, {
+                'id': f"chatcmpl-fake-{random.randint(0, 1 << 30)}",
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': request.get('model', 'fake'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': text},
+                    'finish_reason': 'stop'
+                }],
+                'usage': {
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': completion_tokens,
+                    'total_tokens': prompt_tokens + completion_tokens
+                }
+            })
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host='127.0.0.1', port=8765, delay=0.0, fail_every=0):
+    server = ThreadingHTTPServer((host, port), make_handler(delay, fail_every))
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.0)
+    parser.add_argument('--fail-every', type=int, default=0)
+    args = parser.parse_args()
+    print(f"Fake OpenAI listening on http://{args.host}:{args.port}/v1")
+    serve(args.host, args.port, args.delay, args.fail_every).serve_forever()
@@ -0,0 +1,148 @@
+"""
+Duplicate application submissions must collapse into one application and
+one vendor pull: double clicks and client retries (same idempotency key)
+as well as parallel tabs (different keys) for the same renter and house.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+TMP_DIR = tempfile.mkdtemp()
+os.environ.update(
+    FLASK_ENV='development',
+    SECRET_KEY='test',
+    DATABASE_URL=f"sqlite:///{os.path.join(TMP_DIR, 'test.db')}",
+    RATELIMIT_BACKEND='off',
+    TEMPLATE_CACHE_DIR=os.path.join(TMP_DIR, 'jinja_cache'),
+    TEMPLATE_WARMUP='false',
+    UPLOAD_FOLDER=os.path.join(TMP_DIR, 'uploads'),
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+from app import app, db, create_user, House, Application, ScreeningReport  # noqa: E402
+
+SUBMISSIONS = 8
+PASSWORD = 'secret'
+REPORT = {
+    "credit_score": 780,
+    "skip_trace": {"emails": ["renter@test.local"], "phones": [], "addresses": []},
+    "income_summary": {"employer": "Acme Corp", "monthly_income": 9000},
+}
+
+
+@pytest.fixture
+def setup_db():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        landlord = create_user('Landlord', 'landlord@test.local', 'landlord', PASSWORD)
+        renter = create_user('Renter', 'renter@test.local', 'renter', PASSWORD)
+        house = House(title='Test House', description='Test', rent=1800, landlord_id=landlord.id)
+        db.session.add(house)
+        db.session.commit()
+        ids = {'renter': renter.id, 'house': house.id}
+    yield ids
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def vendor(monkeypatch):
+    """Counts vendor pulls; slow enough that concurrent submissions overlap."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_fetch_vendor_report(renter):
+        with lock:
+            calls.append(renter.id)
+        time.sleep(0.5)
+        return REPORT
+
+    monkeypatch.setattr(app_module, 'fetch_vendor_report', fake_fetch_vendor_report)
+    return calls
+
+
+def logged_in_client():
+    client = app.test_client()
+    resp = client.post('/login', data={'email': 'renter@test.local', 'password': PASSWORD})
+    assert resp.status_code == 302
+    return client
+
+
+def submit_concurrently(house_id, keys):
+    clients = [logged_in_client() for _ in keys]
+    barrier = threading.Barrier(len(keys))
+    statuses = []
+    errors = []
+
+    def submit(client, key):
+        try:
+            barrier.wait()
+            resp = client.post(f'/apply/{house_id}', data={
+                'phone': '555-0100',
+                'move_in': '2030-01-01',
+                'notes': '',
+                'idempotency_key': key,
+            })
+            statuses.append(resp.status_code)
+        except Exception as e:  # surfaced in the main thread below
+            errors.append(e)
+
+    threads = [threading.Thread(target=submit, args=(c, k)) for c, k in zip(clients, keys)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    return statuses
+
+
+def applications_for(ids):
+    with app.app_context():
+        return Application.query.filter_by(house_id=ids['house'], renter_id=ids['renter']).all()
+
+
+def test_retries_with_same_key_create_one_application(setup_db, vendor):
+    statuses = submit_concurrently(setup_db['house'], ['same-key'] * SUBMISSIONS)
+
+    assert statuses == [302] * SUBMISSIONS
+    applications = applications_for(setup_db)
+    assert len(applications) == 1
+    assert applications[0].credit_score == REPORT['credit_score']
+    assert len(vendor) == 1
+
+
+def test_parallel_tabs_create_one_application(setup_db, vendor):
+    statuses = submit_concurrently(setup_db['house'], [f'tab-{i}' for i in range(SUBMISSIONS)])
+
+    assert statuses == [302] * SUBMISSIONS
+    assert len(applications_for(setup_db)) == 1
+    assert len(vendor) == 1
+
+
+def test_failed_screening_can_be_retried(setup_db, monkeypatch):
+    def unavailable(renter):
+        raise RuntimeError('vendor down')
+
+    monkeypatch.setattr(app_module, 'fetch_vendor_report', unavailable)
+    client = logged_in_client()
+    form = {'phone': '555-0100', 'move_in': '2030-01-01', 'notes': '', 'idempotency_key': 'retry-key'}
+
+    resp = client.post(f"/apply/{setup_db['house']}", data=form)
+    assert resp.status_code == 200  # form shown again with the error
+    assert applications_for(setup_db) == []
+    with app.app_context():
+        assert ScreeningReport.query.count() == 0
+
+    monkeypatch.setattr(app_module, 'fetch_vendor_report', lambda renter: REPORT)
+    resp = client.post(f"/apply/{setup_db['house']}", data=form)
+    assert resp.status_code == 302
+    applications = applications_for(setup_db)
+    assert len(applications) == 1
+    assert applications[0].credit_score == REPORT['credit_score']
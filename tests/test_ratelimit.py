@@ -0,0 +1,37 @@
+"""
+A request refused by one bucket must not spend tokens from the others, in
+either backend.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.ratelimit import MemoryBackend, SQLiteBackend, RateLimiter  # noqa: E402
+
+RULES = {'apply': {'ip': (60, 5), 'user': (60, 2)}}
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def limiter(request, tmp_path):
+    if request.param == 'sqlite':
+        backend = SQLiteBackend(str(tmp_path / 'ratelimit.db'))
+    else:
+        backend = MemoryBackend()
+    return RateLimiter(backend, rules=RULES, concurrency={})
+
+
+def test_rejected_request_keeps_other_tokens(limiter, monkeypatch):
+    monkeypatch.setattr('config.ratelimit.time.time', lambda: 1000.0)
+    heavy = {'ip': '10.0.0.1', 'user': 1}
+    assert limiter.take('apply', 'apply', heavy) == 0
+    assert limiter.take('apply', 'apply', heavy) == 0
+    # user 1 is out of tokens; the shared ip bucket must not be charged for it
+    for _ in range(5):
+        assert limiter.take('apply', 'apply', heavy) > 0
+
+    others = [{'ip': '10.0.0.1', 'user': n} for n in (2, 3, 4)]
+    assert [limiter.take('apply', 'apply', identities) for identities in others] == [0, 0, 0]
+    assert limiter.take('apply', 'apply', {'ip': '10.0.0.1', 'user': 5}) > 0
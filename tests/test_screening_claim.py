@@ -0,0 +1,70 @@
+"""
+A vendor pull that outlives its claim must not overwrite the claim another
+worker has taken since; its result is kept as a report row of its own.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+TMP_DIR = tempfile.mkdtemp()
+os.environ.update(
+    FLASK_ENV='development',
+    SECRET_KEY='test',
+    DATABASE_URL=f"sqlite:///{os.path.join(TMP_DIR, 'test.db')}",
+    RATELIMIT_BACKEND='off',
+    TEMPLATE_CACHE_DIR=os.path.join(TMP_DIR, 'jinja_cache'),
+    TEMPLATE_WARMUP='false',
+    UPLOAD_FOLDER=os.path.join(TMP_DIR, 'uploads'),
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+from app import app, db, create_user, ScreeningReport, User  # noqa: E402
+
+REPORT = {"credit_score": 700, "skip_trace": {}, "income_summary": {"monthly_income": 5000}}
+
+
+@pytest.fixture
+def renter_id(monkeypatch):
+    monkeypatch.setitem(app.config, 'SCREENING_CLAIM_STALE_SECONDS', 1)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        renter_id = create_user('Renter', 'renter@test.local', 'renter', 'secret').id
+    yield renter_id
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def test_slow_pull_keeps_newer_claim(renter_id, monkeypatch):
+    def slow_fetch_vendor_report(renter):
+        time.sleep(2.5)
+        return REPORT
+
+    monkeypatch.setattr(app_module, 'fetch_vendor_report', slow_fetch_vendor_report)
+    results = []
+
+    def leader():
+        with app.app_context():
+            results.append(app_module.get_screening_report(db.session.get(User, renter_id)))
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    time.sleep(1.5)  # the leader's claim is now stale
+    with app.app_context():
+        claim = app_module.claim_screening(renter_id)
+        assert claim is not None
+        claim_id = claim.id
+    thread.join()
+
+    assert results == [REPORT]
+    with app.app_context():
+        claim = db.session.get(ScreeningReport, claim_id)
+        assert claim.pending and claim.credit_score is None
+        stored = ScreeningReport.query.filter_by(renter_id=renter_id, pending=False).all()
+        assert [r.credit_score for r in stored] == [REPORT['credit_score']]